@@ -20,32 +20,34 @@
 # It takes no inputs; it searches the working directory recursively
 # for files named design_checks_violated.log.
 
+import os
 import re
 from pathlib import Path
 import pandas as pd
 
 file_list =[]
-for filename in Path('.').glob('**/design_checks_violated.log'):
-    file_list.append(filename)
-df = pd.DataFrame(columns=['Type','Rule','File','Message','Design'])
-type_re = re.compile('^\s*\*\*\*\*\s+([A-Z]*)')
-violation_re = re.compile('([A-Z]+)\s+(\w+.(?:h|cpp):[0-9]+,[0-9]+)\s+(.*)')
-row = 0
+for dirpath, dirnames, filenames in os.walk('.'):
+    if ('design_checks_violated.log' in filenames):
+        file_list.append(Path(dirpath, 'design_checks_violated.log'))
+type_re = re.compile(r'^\s*\*\*\*\*\s+([A-Z]*)')
+violation_re = re.compile(r'([A-Z]+)\s+(\w+.(?:h|cpp):[0-9]+,[0-9]+)\s+(.*)')
+rows = []
 for filename in file_list:
     print(filename)
-    filelines = open(str(filename),'r').readlines()
     violation_type='' # Warning, Fatal, Error, Info
-    for line in filelines:
-        if (type_re.match(line)):
+    with open(str(filename),'r') as f:
+        for line in f:
             m = type_re.match(line)
-            violation_type = m.group(1)
-        if (violation_re.match(line)):
+            if (m):
+                violation_type = m.group(1)
+                continue
             m = violation_re.match(line)
-            rule = m.group(1)
-            source = m.group(2)
-            message = m.group(3).strip('\n')
-            if (not re.search('spec_wrapper',source)):
-                df.loc[row] = violation_type, rule, source, message, filename
-                row += 1
+            if (m):
+                rule = m.group(1)
+                source = m.group(2)
+                message = m.group(3).strip('\n')
+                if ('spec_wrapper' not in source):
+                    rows.append((violation_type, rule, source, message, filename))
 
+df = pd.DataFrame(rows, columns=['Type','Rule','File','Message','Design'])
 df.to_csv('DesignCheckSummary.csv',index=False)